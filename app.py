@@ -1,10 +1,20 @@
 import streamlit as st
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import os
+import base64
+import re
+import time
+import threading
+from collections import OrderedDict
 from dotenv import load_dotenv
 
 st.set_page_config(
@@ -19,104 +29,337 @@ load_dotenv()
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
 headers = {'Authorization': f'token {GITHUB_TOKEN}'} if GITHUB_TOKEN else {}
 
+# Number of trailing weeks shown for each commit activity timeframe
+TIMEFRAME_WEEKS = {
+    "Last Week": 1,
+    "Last Month": 4,
+    "Last 3 Months": 12,
+    "Last 6 Months": 26,
+    "All Time": 52
+}
+
+# Matches github.com/<owner>/<repo>, ignoring any trailing path such as /tree/main
+_GH_URL_RE = re.compile(
+    r'^(?:https?://)?(?:www\.)?github\.com/([^/?#\s]+)/([^/?#\s]+?)(?:\.git)?/?(?:[/?#].*)?$',
+    re.IGNORECASE
+)
+
+# Number of URLs whose ETag and body are kept for conditional requests
+ETAG_CACHE_SIZE = 256
+
+# Stop issuing requests once fewer than this many remain in the rate-limit window
+RATE_LIMIT_FLOOR = 5
+
+# Attempts per GitHub request, with exponential backoff on 502/503/504 and timeouts
+MAX_ATTEMPTS = 4
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = {502, 503, 504}
+
+@st.cache_resource
+def _github_slots():
+    """Creating a process-wide semaphore capping in-flight GitHub requests across sessions"""
+    return threading.BoundedSemaphore(8)
+
+@st.cache_resource
+def get_session():
+    """Creating a shared keep-alive session so API calls reuse one pooled connection"""
+    session = requests.Session()
+    # Retries are handled in conditional_get so waits never hold a request slot
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+    session.mount('https://', adapter)
+    return session
+
+class GitHubAPIError(Exception):
+    """Raised for non-200 GitHub API responses so that failures are never cached"""
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+def get_rate_limit_reset():
+    """Returning the rate-limit reset time if the remaining quota is nearly exhausted"""
+    remaining, reset = st.session_state.get('rate_limit', (None, 0))
+    if remaining is not None and remaining < RATE_LIMIT_FLOOR and time.time() < reset:
+        return datetime.fromtimestamp(reset)
+    return None
+
+def _record_rate_limit(response):
+    """Storing the rate-limit headers of a GitHub response in the session state"""
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    reset = response.headers.get('X-RateLimit-Reset')
+    if remaining is not None and reset is not None:
+        st.session_state['rate_limit'] = (int(remaining), int(reset))
+
+class ETagCache:
+    """Thread-safe LRU of (etag, body) pairs from previous GitHub responses, keyed by URL"""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url, etag, body):
+        with self._lock:
+            self._entries[url] = (etag, body)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+@st.cache_resource
+def _etag_cache():
+    """Creating the process-wide ETag cache used for conditional requests"""
+    return ETagCache(ETAG_CACHE_SIZE)
+
+def _retry_delay(response, attempt):
+    """Returning how long to wait before retrying a response, or None to stop"""
+    retry_after = response.headers.get('Retry-After')
+    if response.status_code == 403 and retry_after:
+        # Retrying GitHub's secondary rate limit only once
+        if attempt > 0:
+            return None
+        return min(int(retry_after), 60) if retry_after.isdigit() else 60
+    if response.status_code in RETRY_STATUSES:
+        return RETRY_BACKOFF * 2 ** attempt
+    return None
+
+def _send(url, request_headers):
+    """Sending a GitHub request with retries, holding a request slot only while an attempt is in flight"""
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        try:
+            with _github_slots():
+                response = get_session().get(url, headers=request_headers, timeout=10)
+        except (requests.ConnectionError, requests.Timeout):
+            if last_attempt:
+                raise
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+            continue
+        
+        delay = _retry_delay(response, attempt)
+        if delay is None or last_attempt:
+            return response
+        time.sleep(delay)
+
+def conditional_get(url):
+    """Issuing a conditional GET so unchanged resources come back as a bodyless 304"""
+    etags = _etag_cache()
+    cached = etags.get(url)
+    request_headers = dict(headers)
+    if cached:
+        request_headers['If-None-Match'] = cached[0]
+    
+    response = _send(url, request_headers)
+    _record_rate_limit(response)
+    
+    # 304 responses do not count against the rate limit
+    if response.status_code == 304 and cached:
+        return 200, cached[1]
+    
+    try:
+        data = orjson.loads(response.content)
+    except ValueError:
+        data = None
+    if response.status_code == 200 and response.headers.get('ETag'):
+        etags.set(url, response.headers['ETag'], data)
+    return response.status_code, data
+
+def _get_json(url):
+    """Fetching a GitHub API endpoint and decoding its JSON body"""
+    if get_rate_limit_reset():
+        raise GitHubAPIError(403, 'GitHub API rate limit nearly exhausted')
+    
+    status_code, data = conditional_get(url)
+    if status_code != 200:
+        message = data.get('message') if isinstance(data, dict) else None
+        raise GitHubAPIError(status_code, message or 'Failed to fetch data from GitHub')
+    return data
+
+# Cached fetchers are keyed by (owner, repo) so reruns triggered by widgets
+# never hit the network. The cache is shared across sessions, which is fine
+# for public repository data.
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_repo(owner, repo):
+    """Fetching repository metadata"""
+    return _get_json(f'https://api.github.com/repos/{owner}/{repo}')
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_commits(owner, repo):
+    """Fetching weekly commit activity for the last year"""
+    return _get_json(f'https://api.github.com/repos/{owner}/{repo}/stats/commit_activity')
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_contributors(owner, repo):
+    """Fetching repository contributors"""
+    return _get_json(f'https://api.github.com/repos/{owner}/{repo}/contributors')
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_readme(owner, repo):
+    """Fetching base64-encoded README content without its line breaks"""
+    readme_data = _get_json(f'https://api.github.com/repos/{owner}/{repo}/readme')
+    return readme_data['content'].replace('\n', '')
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_languages(languages_url):
+    """Fetching language statistics"""
+    return _get_json(languages_url)
+
+def decode_readme(encoded, max_chars=None):
+    """Decoding base64 README content, optionally only as far as a preview needs"""
+    if max_chars is None:
+        return base64.b64decode(encoded).decode('utf-8', errors='replace')
+    
+    # UTF-8 needs at most 4 bytes per character and base64 encodes 3 bytes as 4 chars
+    prefix_length = -(-max_chars * 4 // 3) * 4
+    prefix = base64.b64decode(encoded[:prefix_length])
+    return prefix.decode('utf-8', errors='ignore')[:max_chars]
+
 def get_readme_content(owner, repo):
-    """Fetching and decoding README content from GitHub repository"""
+    """Fetching base64-encoded README content from GitHub repository"""
     try:
-        readme_url = f'https://api.github.com/repos/{owner}/{repo}/readme'
-        readme_response = requests.get(readme_url, headers=headers)
-        
-        if readme_response.status_code == 200:
-            import base64
-            readme_data = readme_response.json()
-            content = base64.b64decode(readme_data['content']).decode('utf-8')
-            return content
+        return _fetch_readme(owner, repo)
+    except GitHubAPIError:
         return None
     except Exception as e:
         st.error(f"Error fetching README: {str(e)}")
         return None
 
+def get_commit_activity(owner, repo):
+    """Fetching commit activity, falling back to an empty list"""
+    try:
+        return _fetch_commits(owner, repo)
+    except (GitHubAPIError, requests.RequestException):
+        return []
+
+def get_contributors(owner, repo):
+    """Fetching contributors, falling back to an empty list"""
+    try:
+        return _fetch_contributors(owner, repo)
+    except (GitHubAPIError, requests.RequestException):
+        return []
+
+def _normalize_repo_url(repo_url):
+    """Normalizing a repository URL to its lowercase (owner, repo) for equality checks"""
+    match = _GH_URL_RE.match(repo_url.strip())
+    if not match:
+        return repo_url.strip().rstrip('/').lower()
+    return tuple(part.lower() for part in match.groups())
+
+def _executor(max_workers):
+    """Creating a thread pool whose workers share the current Streamlit script context"""
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    )
+
 def get_repo_info(repo_url):
     """Extracting owner and repo name from GitHub URL and fetch repository data"""
     try:
         # Parsing URL to get owner and repo
-        parts = repo_url.strip('/').split('/')
-        owner, repo = parts[-2], parts[-1]
-        
-        # Fetching repository information
-        repo_api_url = f'https://api.github.com/repos/{owner}/{repo}'
-        repo_response = requests.get(repo_api_url, headers=headers)
-        repo_data = repo_response.json()
-        
-        if repo_response.status_code != 200:
-            st.error(f"Error: {repo_data.get('message', 'Failed to fetch repository data')}")
+        match = _GH_URL_RE.match(repo_url.strip())
+        if not match:
+            st.error("Error: Invalid GitHub repository URL. Expected https://github.com/owner/repo")
             return None
+        owner, repo = match.groups()
         
-        # Fetching commit activity
-        commits_url = f'{repo_api_url}/stats/commit_activity'
-        commits_response = requests.get(commits_url, headers=headers)
-        commits_data = commits_response.json() if commits_response.status_code == 200 else []
-        
-        # Fetching contributors
-        contributors_url = f'{repo_api_url}/contributors'
-        contributors_response = requests.get(contributors_url, headers=headers)
-        contributors_data = contributors_response.json() if contributors_response.status_code == 200 else []
+        # Fetching repository information
+        repo_data = _fetch_repo(owner, repo)
         
-        # Fetching README content
-        readme_content = get_readme_content(owner, repo)
+        # Fetching commits, contributors, README and languages concurrently
+        result = {'repo_data': repo_data}
+        with _executor(4) as executor:
+            futures = {
+                executor.submit(get_commit_activity, owner, repo): 'commits_data',
+                executor.submit(get_contributors, owner, repo): 'contributors_data',
+                executor.submit(get_readme_content, owner, repo): 'readme_encoded',
+                executor.submit(get_language_stats, repo_data.get('languages_url')): 'lang_data'
+            }
+            for future in as_completed(futures):
+                result[futures[future]] = future.result()
         
-        return {
-            'repo_data': repo_data,
-            'commits_data': commits_data,
-            'contributors_data': contributors_data,
-            'readme_content': readme_content
-        }
+        # Preparing chart inputs once so widget reruns skip the rebuilding
+        result['contributor_index'] = build_contributor_index(result['contributors_data'])
+        result['lang_pie'] = build_lang_pie(result['lang_data'])
+        result['commit_slices'] = build_commit_slices(result['commits_data'])
+        return result
     except Exception as e:
         st.error(f"Error: {str(e)}")
         return None
 
-def get_language_stats(repo_data):
-    """Extracting language statistics from repository data"""
-    if not repo_data.get('languages_url'):
+def get_language_stats(languages_url):
+    """Fetching language statistics from a repository's languages URL"""
+    if not languages_url:
         return {}
     
-    languages_response = requests.get(repo_data['languages_url'], headers=headers)
-    if languages_response.status_code == 200:
-        return languages_response.json()
-    return {}
+    try:
+        return _fetch_languages(languages_url)
+    except (GitHubAPIError, requests.RequestException):
+        return {}
+
+def _parse_gh_ts(timestamp):
+    """Parsing an ISO 8601 GitHub timestamp such as 2024-01-31T12:00:00Z"""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+def generate_report(repo_data, commits_data, contributors_data):
+    """Generating a detailed report for the repository as UTF-8 bytes"""
+    # The header carries the generation time, so it stays outside the shared cache
+    header = "\n".join([
+        f"Repository Analysis Report for {repo_data['name']}",
+        "=" * 50,
+        f"\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    ])
+    body = _render_report(
+        repo_data['full_name'],
+        repo_data['updated_at'],
+        len(commits_data),
+        len(contributors_data),
+        repo_data,
+        commits_data,
+        contributors_data
+    )
+    return header.encode('utf-8') + b"\n" + body
 
-def generate_report(repo_data, commits_data, contributors_data, is_comparison=False):
-    """Generating a detailed report for the repository"""
+# Underscore-prefixed arguments are excluded from the cache key, so the
+# report is only rebuilt when the repository itself changes
+@st.cache_data(ttl=600, show_spinner=False)
+def _render_report(full_name, updated_at, weeks_count, contributors_count, _repo_data, _commits_data, _contributors_data):
+    """Rendering the report body for a repository snapshot"""
     report = []
     
     # Repository metadata
-    report.append(f"Repository Analysis Report for {repo_data['name']}")
-    report.append("=" * 50)
-    report.append(f"\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     report.append("\nRepository Metadata:")
     report.append("-" * 20)
-    report.append(f"Name: {repo_data['name']}")
-    report.append(f"Owner: {repo_data['owner']['login']}")
-    report.append(f"Description: {repo_data['description'] or 'No description provided'}")
-    report.append(f"Stars: {repo_data['stargazers_count']}")
-    report.append(f"Forks: {repo_data['forks_count']}")
-    report.append(f"Open Issues: {repo_data['open_issues_count']}")
-    report.append(f"Watchers: {repo_data['watchers_count']}")
-    report.append(f"Created: {datetime.strptime(repo_data['created_at'], '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d')}")
-    report.append(f"Last Updated: {datetime.strptime(repo_data['updated_at'], '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d')}")
+    report.append(f"Name: {_repo_data['name']}")
+    report.append(f"Owner: {_repo_data['owner']['login']}")
+    report.append(f"Description: {_repo_data['description'] or 'No description provided'}")
+    report.append(f"Stars: {_repo_data['stargazers_count']}")
+    report.append(f"Forks: {_repo_data['forks_count']}")
+    report.append(f"Open Issues: {_repo_data['open_issues_count']}")
+    report.append(f"Watchers: {_repo_data['watchers_count']}")
+    created = _parse_gh_ts(_repo_data['created_at'])
+    updated = _parse_gh_ts(_repo_data['updated_at'])
+    report.append(f"Created: {created.strftime('%Y-%m-%d')}")
+    report.append(f"Last Updated: {updated.strftime('%Y-%m-%d')}")
     
     # Top contributors
     report.append("\nTop Contributors:")
     report.append("-" * 20)
-    for i, contributor in enumerate(contributors_data[:10], 1):
-        report.append(f"{i}. {contributor['login']}: {contributor['contributions']} contributions")
+    report.extend(
+        f"{i}. {c['login']}: {c['contributions']} contributions"
+        for i, c in enumerate(_contributors_data[:10], 1)
+    )
     
     # Weekly commit activity
     report.append("\nWeekly Commit Activity (Last 52 weeks):")
     report.append("-" * 20)
-    for i, week in enumerate(commits_data):
-        report.append(f"Week {i+1}: {week['total']} commits")
+    report.extend(f"Week {i}: {w['total']} commits" for i, w in enumerate(_commits_data, 1))
     
-    return "\n".join(report)
+    return "\n".join(report).encode('utf-8')
 
 def display_repo_metrics(repo_data, column):
     """Displaying the repository metrics"""
@@ -134,46 +377,46 @@ def display_repo_details(repo_data, col):
     with col:
         st.write(f"**Description:** {repo_data['description'] or 'No description'}")
         st.write(f"**Language:** {repo_data['language'] or 'Not specified'}")
-        st.write(f"**Created:** {datetime.strptime(repo_data['created_at'], '%Y-%m-%dT%H:%M:%SZ').strftime('%B %d, %Y')}")
+        st.write(f"**Created:** {_parse_gh_ts(repo_data['created_at']).strftime('%B %d, %Y')}")
         st.write(f"**Owner:** {repo_data['owner']['login']}")
         st.write(f"**License:** {repo_data['license']['name'] if repo_data['license'] else 'Not specified'}")
-        st.write(f"**Last Updated:** {datetime.strptime(repo_data['updated_at'], '%Y-%m-%dT%H:%M:%SZ').strftime('%B %d, %Y')}")
+        st.write(f"**Last Updated:** {_parse_gh_ts(repo_data['updated_at']).strftime('%B %d, %Y')}")
+
+def filter_commits_by_timeframe(commits, timeframe_weeks):
+    """Filtering weekly commit totals based on selected timeframe"""
+    if timeframe_weeks >= len(commits):
+        return commits
+    return commits[-timeframe_weeks:]
 
-def filter_commits_by_timeframe(commits_data, timeframe_weeks):
-    """Filtering commit data based on selected timeframe"""
-    if not commits_data or timeframe_weeks >= len(commits_data):
-        return commits_data
-    return commits_data[-timeframe_weeks:]
+def build_commit_slices(commits_data):
+    """Precomputing weekly commit totals for every selectable timeframe"""
+    if not commits_data:
+        return None
+    commits = np.fromiter((w['total'] for w in commits_data), dtype=np.int32, count=len(commits_data))
+    return {weeks: filter_commits_by_timeframe(commits, weeks) for weeks in TIMEFRAME_WEEKS.values()}
 
-def plot_commit_activity(commits_data1, commits_data2=None, repo1_name="Repository 1", repo2_name="Repository 2", timeframe="All Time"):
+def plot_commit_activity(commit_slices1, commit_slices2=None, repo1_name="Repository 1", repo2_name="Repository 2", timeframe="All Time"):
     """Plotting commit activity comparison chart with timeframe filtering"""
     fig = go.Figure()
     
-    timeframe_mapping = {
-        "Last Week": 1,
-        "Last Month": 4,
-        "Last 3 Months": 12,
-        "Last 6 Months": 26,
-        "All Time": 52
-    }
-    weeks_to_show = timeframe_mapping.get(timeframe, 52)
-    
-    if commits_data1:
-        filtered_data1 = filter_commits_by_timeframe(commits_data1, weeks_to_show)
-        weeks = list(range(len(filtered_data1)))
-        commits1 = [week['total'] for week in filtered_data1]
-        fig.add_trace(go.Scatter(
+    weeks_to_show = TIMEFRAME_WEEKS.get(timeframe, 52)
+    
+    # Anchoring x at 0 for the latest week so every timeframe shares the same axis
+    
+    if commit_slices1:
+        commits1 = commit_slices1[weeks_to_show]
+        weeks = np.arange(1 - len(commits1), 1)
+        fig.add_trace(go.Scattergl(
             x=weeks,
             y=commits1,
             name=repo1_name,
             line=dict(color='#2ecc71')
         ))
     
-    if commits_data2:
-        filtered_data2 = filter_commits_by_timeframe(commits_data2, weeks_to_show)
-        weeks = list(range(len(filtered_data2)))
-        commits2 = [week['total'] for week in filtered_data2]
-        fig.add_trace(go.Scatter(
+    if commit_slices2:
+        commits2 = commit_slices2[weeks_to_show]
+        weeks = np.arange(1 - len(commits2), 1)
+        fig.add_trace(go.Scattergl(
             x=weeks,
             y=commits2,
             name=repo2_name,
@@ -184,20 +427,28 @@ def plot_commit_activity(commits_data1, commits_data2=None, repo1_name="Reposito
         title=f"Weekly Commit Activity ({timeframe})",
         xaxis_title="Weeks Ago",
         yaxis_title="Number of Commits",
-        showlegend=True
+        showlegend=True,
+        # Keeping zoom across timeframes, but not across repositories
+        uirevision=f"{repo1_name}|{repo2_name}"
     )
     return fig
 
-def plot_language_comparison(lang_data1, lang_data2=None, repo1_name="Repository 1", repo2_name="Repository 2"):
+def build_lang_pie(lang_data):
+    """Splitting language statistics into label and value tuples for a pie chart"""
+    if not lang_data:
+        return None
+    return tuple(lang_data.keys()), tuple(lang_data.values())
+
+def plot_language_comparison(lang_pie1, lang_pie2=None, repo1_name="Repository 1", repo2_name="Repository 2"):
     """Plotting language usage using pie charts"""
-    if lang_data2:
+    if lang_pie2:
         fig = go.Figure()
         
-        if lang_data1:
-            total1 = sum(lang_data1.values())
+        if lang_pie1:
+            labels1, values1 = lang_pie1
             fig.add_trace(go.Pie(
-                labels=list(lang_data1.keys()),
-                values=list(lang_data1.values()),
+                labels=labels1,
+                values=values1,
                 name=repo1_name,
                 domain={'x': [0, 0.45]},
                 title=repo1_name,
@@ -206,11 +457,11 @@ def plot_language_comparison(lang_data1, lang_data2=None, repo1_name="Repository
                 marker={'colors': px.colors.qualitative.Set3}
             ))
         
-        if lang_data2:
-            total2 = sum(lang_data2.values())
+        if lang_pie2:
+            labels2, values2 = lang_pie2
             fig.add_trace(go.Pie(
-                labels=list(lang_data2.keys()),
-                values=list(lang_data2.values()),
+                labels=labels2,
+                values=values2,
                 name=repo2_name,
                 domain={'x': [0.55, 1]},
                 title=repo2_name,
@@ -220,11 +471,11 @@ def plot_language_comparison(lang_data1, lang_data2=None, repo1_name="Repository
             ))
     else:
         fig = go.Figure()
-        if lang_data1:
-            total1 = sum(lang_data1.values())
+        if lang_pie1:
+            labels1, values1 = lang_pie1
             fig.add_trace(go.Pie(
-                labels=list(lang_data1.keys()),
-                values=list(lang_data1.values()),
+                labels=labels1,
+                values=values1,
                 name=repo1_name,
                 textinfo='percent',
                 hoverinfo='label+percent',
@@ -238,34 +489,39 @@ def plot_language_comparison(lang_data1, lang_data2=None, repo1_name="Repository
     )
     return fig
 
-def filter_contributors(contributors_data, username_filter=None):
-    """Filtering contributors based on username"""
+def build_contributor_index(contributors_data):
+    """Building (lowercase login, login, contributions) tuples for each contributor"""
+    return [(c['login'].lower(), c['login'], c['contributions']) for c in contributors_data]
+
+def filter_contributors(contributor_index, username_filter=None):
+    """Filtering indexed contributors based on username"""
     if not username_filter:
-        return contributors_data[:10]
+        return contributor_index[:10]
     
-    filtered = [c for c in contributors_data if username_filter.lower() in c['login'].lower()]
+    needle = username_filter.lower()
+    filtered = [entry for entry in contributor_index if needle in entry[0]]
     return filtered[:10]
 
-def plot_top_contributors(contributors_data1, contributors_data2=None, repo1_name="Repository 1", repo2_name="Repository 2", username_filter=None):
+def plot_top_contributors(contributor_index1, contributor_index2=None, repo1_name="Repository 1", repo2_name="Repository 2", username_filter=None):
     """Ploting top contributors comparison chart with username filtering"""
     fig = go.Figure()
     
-    if contributors_data1:
-        filtered_contributors1 = filter_contributors(contributors_data1, username_filter)
+    if contributor_index1:
+        filtered_contributors1 = filter_contributors(contributor_index1, username_filter)
         if filtered_contributors1:
             fig.add_trace(go.Bar(
-                x=[c['login'] for c in filtered_contributors1],
-                y=[c['contributions'] for c in filtered_contributors1],
+                x=[login for _, login, _ in filtered_contributors1],
+                y=[contributions for _, _, contributions in filtered_contributors1],
                 name=repo1_name,
                 marker_color='#2ecc71'
             ))
     
-    if contributors_data2:
-        filtered_contributors2 = filter_contributors(contributors_data2, username_filter)
+    if contributor_index2:
+        filtered_contributors2 = filter_contributors(contributor_index2, username_filter)
         if filtered_contributors2:
             fig.add_trace(go.Bar(
-                x=[c['login'] for c in filtered_contributors2],
-                y=[c['contributions'] for c in filtered_contributors2],
+                x=[login for _, login, _ in filtered_contributors2],
+                y=[contributions for _, _, contributions in filtered_contributors2],
                 name=repo2_name,
                 marker_color='#3498db'
             ))
@@ -283,6 +539,53 @@ def plot_top_contributors(contributors_data1, contributors_data2=None, repo1_nam
     )
     return fig
 
+def contributor_filter_input():
+    """Rendering the contributor filter inside a form so it only reruns on submit"""
+    with st.form("contrib_form"):
+        username_filter = st.text_input(
+            "Filter contributors by username:",
+            placeholder="Enter username or leave empty for top 10",
+            key="contrib_filter"
+        )
+        st.form_submit_button("Apply")
+    return username_filter
+
+# Fragments rerun on their own widget interactions without re-executing
+# the surrounding analysis view
+@st.fragment
+def commit_activity_fragment(commit_slices1, commit_slices2=None, repo1_name="Repository 1", repo2_name="Repository 2"):
+    """Displaying the timeframe selector and commit activity chart"""
+    timeframe = st.selectbox(
+        "Select Timeframe:",
+        list(TIMEFRAME_WEEKS),
+        index=4
+    )
+    st.plotly_chart(
+        plot_commit_activity(
+            commit_slices1,
+            commit_slices2,
+            repo1_name,
+            repo2_name,
+            timeframe=timeframe
+        ),
+        use_container_width=True
+    )
+
+@st.fragment
+def contributors_fragment(contributor_index1, contributor_index2=None, repo1_name="Repository 1", repo2_name="Repository 2"):
+    """Displaying the contributor filter and top contributors chart"""
+    username_filter = contributor_filter_input()
+    st.plotly_chart(
+        plot_top_contributors(
+            contributor_index1,
+            contributor_index2,
+            repo1_name,
+            repo2_name,
+            username_filter=username_filter
+        ),
+        use_container_width=True
+    )
+
 def analyze_single_repo(repo_url):
     """Analyzing and displaying metrics for a single repository"""
     if not repo_url:
@@ -312,32 +615,17 @@ def analyze_single_repo(repo_url):
         mime="text/plain"
     )
     
-    # Getting language statistics
-    lang_data = get_language_stats(repo_data)
-    
     # Visualizations
     st.header("Analysis")
     
     # Commit activity with timeframe selection
     st.subheader("Commit Activity")
-    timeframe = st.selectbox(
-        "Select Timeframe:",
-        ["Last Week", "Last Month", "Last 3 Months", "Last 6 Months", "All Time"],
-        index=4
-    )
-    st.plotly_chart(
-        plot_commit_activity(
-            data['commits_data'],
-            repo1_name=repo_data['name'],
-            timeframe=timeframe
-        ),
-        use_container_width=True
-    )
+    commit_activity_fragment(data['commit_slices'], repo1_name=repo_data['name'])
     
     # Language distribution
     st.plotly_chart(
         plot_language_comparison(
-            lang_data,
+            data['lang_pie'],
             repo1_name=repo_data['name']
         ),
         use_container_width=True
@@ -345,32 +633,22 @@ def analyze_single_repo(repo_url):
     
     # Contributors with username filter
     st.subheader("Contributors")
-    username_filter = st.text_input(
-        "Filter contributors by username:",
-        placeholder="Enter username or leave empty for top 10"
-    )
-    st.plotly_chart(
-        plot_top_contributors(
-            data['contributors_data'],
-            repo1_name=repo_data['name'],
-            username_filter=username_filter
-        ),
-        use_container_width=True
-    )
+    contributors_fragment(data['contributor_index'], repo1_name=repo_data['name'])
     
     # README preview
-    if data['readme_content']:
+    if data['readme_encoded']:
         st.markdown("---")
         st.header("📖 README Preview")
         preview_length = 1000
-        readme_content = data['readme_content']
+        preview = decode_readme(data['readme_encoded'], preview_length + 1)
         
-        if len(readme_content) > preview_length:
-            st.markdown(readme_content[:preview_length] + "...")
-            with st.expander("Read more"):
-                st.markdown(readme_content)
+        if len(preview) > preview_length:
+            st.markdown(preview[:preview_length] + "...")
+            # Expander bodies always run, so the full README sits behind a toggle
+            if st.toggle("Read more"):
+                st.markdown(decode_readme(data['readme_encoded']))
         else:
-            st.markdown(readme_content)
+            st.markdown(preview)
 
 def analyze_compare_repos(repo_url1, repo_url2):
     """Comparing and displaying metrics for two repositories"""
@@ -378,9 +656,16 @@ def analyze_compare_repos(repo_url1, repo_url2):
         st.info("Please enter both repository URLs for comparison.")
         return
     
-    # Getting data for both repositories
-    data1 = get_repo_info(repo_url1)
-    data2 = get_repo_info(repo_url2)
+    # Analyzing a single repository when both URLs point to the same one
+    if _normalize_repo_url(repo_url1) == _normalize_repo_url(repo_url2):
+        analyze_single_repo(repo_url1)
+        return
+    
+    # Getting data for both repositories concurrently
+    with _executor(2) as executor:
+        future1 = executor.submit(get_repo_info, repo_url1)
+        future2 = executor.submit(get_repo_info, repo_url2)
+        data1, data2 = future1.result(), future2.result()
     
     if not data1 or not data2:
         return
@@ -395,7 +680,7 @@ def analyze_compare_repos(repo_url1, repo_url2):
         display_repo_metrics(data1['repo_data'], col1)
         display_repo_details(data1['repo_data'], col1)
 
-        report1 = generate_report(data1['repo_data'], data1['commits_data'], data1['contributors_data'], True)
+        report1 = generate_report(data1['repo_data'], data1['commits_data'], data1['contributors_data'])
         st.download_button(
             label=f"📥 Download {data1['repo_data']['name']} Report",
             data=report1,
@@ -408,7 +693,7 @@ def analyze_compare_repos(repo_url1, repo_url2):
         st.subheader(f"📊 {data2['repo_data']['name']}")
         display_repo_metrics(data2['repo_data'], col2)
         display_repo_details(data2['repo_data'], col2)
-        report2 = generate_report(data2['repo_data'], data2['commits_data'], data2['contributors_data'], True)
+        report2 = generate_report(data2['repo_data'], data2['commits_data'], data2['contributors_data'])
         st.download_button(
             label=f"📥 Download {data2['repo_data']['name']} Report",
             data=report2,
@@ -416,36 +701,23 @@ def analyze_compare_repos(repo_url1, repo_url2):
             mime="text/plain"
         )
     
-    # Getting language statistics
-    lang_data1 = get_language_stats(data1['repo_data'])
-    lang_data2 = get_language_stats(data2['repo_data'])
-    
     # Visualizations
     st.header("Comparative Analysis")
     
     # Commit activity comparison with timeframe selection
     st.subheader("Commit Activity Comparison")
-    timeframe = st.selectbox(
-        "Select Timeframe:",
-        ["Last Week", "Last Month", "Last 3 Months", "Last 6 Months", "All Time"],
-        index=4
-    )
-    st.plotly_chart(
-        plot_commit_activity(
-            data1['commits_data'],
-            data2['commits_data'],
-            data1['repo_data']['name'],
-            data2['repo_data']['name'],
-            timeframe=timeframe
-        ),
-        use_container_width=True
+    commit_activity_fragment(
+        data1['commit_slices'],
+        data2['commit_slices'],
+        data1['repo_data']['name'],
+        data2['repo_data']['name']
     )
     
     # Language distribution comparison
     st.plotly_chart(
         plot_language_comparison(
-            lang_data1,
-            lang_data2,
+            data1['lang_pie'],
+            data2['lang_pie'],
             data1['repo_data']['name'],
             data2['repo_data']['name']
         ),
@@ -454,19 +726,11 @@ def analyze_compare_repos(repo_url1, repo_url2):
     
     # Contributors comparison with username filter
     st.subheader("Contributors Comparison")
-    username_filter = st.text_input(
-        "Filter contributors by username:",
-        placeholder="Enter username or leave empty for top 10"
-    )
-    st.plotly_chart(
-        plot_top_contributors(
-            data1['contributors_data'],
-            data2['contributors_data'],
-            data1['repo_data']['name'],
-            data2['repo_data']['name'],
-            username_filter=username_filter
-        ),
-        use_container_width=True
+    contributors_fragment(
+        data1['contributor_index'],
+        data2['contributor_index'],
+        data1['repo_data']['name'],
+        data2['repo_data']['name']
     )
 
 def main():
@@ -522,6 +786,10 @@ def main():
         if not (token or GITHUB_TOKEN):
             st.warning("⚠️ No GitHub token found. Some API requests might be rate-limited.")
         
+        rate_limit_reset = get_rate_limit_reset()
+        if rate_limit_reset:
+            st.warning(f"⚠️ GitHub API rate limit nearly exhausted. Requests are paused until {rate_limit_reset.strftime('%H:%M:%S')}.")
+        
         st.markdown("---")
         st.markdown("### How to Use")
         if mode == "Single Repository":